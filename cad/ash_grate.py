@@ -0,0 +1,254 @@
+"""
+Rear Ash Grate and Trough
+=========================
+
+Parametric model of the angled rear grate, collection trough and ash tray
+described in designs/ash-removal-system.md.
+
+Design features:
+- Grate starts flush with the hearth floor and slopes up to the back wall
+- Bar orientation selectable: front-to-back (parallel to slope) or side-to-side
+- Welded steel trough beneath the grate, full grate width
+- Drain opening in the trough floor over a removable tray
+
+The slot pattern is built additively: the grate outline and all slot
+outlines form a single face that is extruded once. There is no boolean per
+slot (2D or 3D), so a grate with 500+ openings rebuilds in about a second.
+
+Run with Shift+Enter in VS Code with OCP CAD Viewer extension.
+"""
+
+from build123d import *
+from math import atan2, cos, degrees, hypot, sin
+import time
+
+# Handle OCP CAD Viewer import (works in VS Code, graceful fallback otherwise)
+try:
+    from ocp_vscode import show, show_object, set_defaults, Camera
+    set_defaults(reset_camera=Camera.KEEP)
+    HAS_VIEWER = True
+except ImportError:
+    def show(*args, **kwargs): pass
+    def show_object(*args, **kwargs): pass
+    HAS_VIEWER = False
+
+# =============================================================================
+# PARAMETERS — PROVISIONAL, CONFIRM AFTER DEMOLITION
+# =============================================================================
+
+INCH = 25.4  # mm
+
+# Coordinate system:
+#   X = across the firebox (width), centered on the grate
+#   Y = front-to-back, +Y toward the rear wall, Y=0 at the grate's front edge
+#   Z = up, Z=0 at hearth floor level
+
+# Angled grate
+GRATE_WIDTH = 25 * INCH         # nearly full firebox width (~24-26")
+GRATE_RUN = 8 * INCH            # horizontal depth, front-to-back
+GRATE_RISE = 3.5 * INCH         # height where the grate meets the back wall (3-4")
+GRATE_THICKNESS = 0.5 * INCH    # bar depth (cast iron or heavy steel bar)
+
+# Bars and openings
+BAR_ORIENTATION = "front_to_back"   # "front_to_back" (parallel to slope) or "side_to_side"
+SLOT_GAP = 0.75 * INCH          # clear opening between bars (3/4" - 1")
+BAR_WIDTH = 0.375 * INCH        # width of each bar
+TIE_PITCH = 2.0 * INCH          # spacing of cross ties that stiffen the bars
+TIE_WIDTH = 0.25 * INCH         # width of each cross tie
+BORDER = 0.5 * INCH             # solid frame around the slotted field
+
+# Trough (welded steel plate)
+TROUGH_HEIGHT = 4.5 * INCH      # depth below hearth level (4-5")
+PLATE_THICKNESS = 0.1875 * INCH # 3/16" steel plate
+
+# Drain opening to the tray (centered in trough floor)
+DRAIN_WIDTH = 10 * INCH
+DRAIN_DEPTH = 5 * INCH
+
+# Ash tray (below drain, slides out toward the wood storage room)
+TRAY_HEIGHT = 3 * INCH
+TRAY_MARGIN = 0.5 * INCH        # tray overhangs drain opening on each side
+TRAY_GAP = 0.25 * INCH          # clearance between trough floor and tray rim
+
+# =============================================================================
+# DERIVED DIMENSIONS
+# =============================================================================
+
+GRATE_ANGLE = degrees(atan2(GRATE_RISE, GRATE_RUN))
+GRATE_SLOPE_LENGTH = hypot(GRATE_RUN, GRATE_RISE)
+
+TROUGH_WIDTH = GRATE_WIDTH + 2 * PLATE_THICKNESS
+
+
+def slot_layout(width, length, orientation=BAR_ORIENTATION):
+    """Return slot size and grid spacing for a grate field.
+
+    `width` runs across the firebox, `length` runs up the slope. Bars run
+    along the orientation direction; cross ties break each slot into
+    openings no longer than TIE_PITCH.
+
+    Returns (slot_x, slot_y, pitch_x, pitch_y, count_x, count_y) in the
+    grate's sketch coordinates (X across, Y up the slope).
+    """
+    field_x = width - 2 * BORDER
+    field_y = length - 2 * BORDER
+
+    # Bars run along the slope: slots repeat across X, ties repeat along Y
+    if orientation == "front_to_back":
+        bar_field, tie_field = field_x, field_y
+    elif orientation == "side_to_side":
+        bar_field, tie_field = field_y, field_x
+    else:
+        raise ValueError(f"Unknown BAR_ORIENTATION: {orientation!r}")
+
+    bar_pitch = SLOT_GAP + BAR_WIDTH
+    bar_count = max(1, int((bar_field + BAR_WIDTH) // bar_pitch))
+    tie_count = max(1, round(tie_field / TIE_PITCH))
+    tie_pitch = tie_field / tie_count
+    opening_length = tie_pitch - TIE_WIDTH
+
+    if orientation == "front_to_back":
+        return (SLOT_GAP, opening_length, bar_pitch, tie_pitch, bar_count, tie_count)
+    return (opening_length, SLOT_GAP, tie_pitch, bar_pitch, tie_count, bar_count)
+
+
+SLOT_X, SLOT_Y, PITCH_X, PITCH_Y, COUNT_X, COUNT_Y = slot_layout(
+    GRATE_WIDTH, GRATE_SLOPE_LENGTH
+)
+OPENING_COUNT = COUNT_X * COUNT_Y
+
+# =============================================================================
+# ANGLED GRATE
+# =============================================================================
+
+def make_grate():
+    """Slotted grate plate, top surface on the slope from hearth to back wall.
+
+    The openings are never cut: the outline and every slot outline are
+    assembled directly into one face (outer wire + inner wires) and that
+    face is extruded once. Build time grows linearly with the opening count.
+    """
+    outline = Wire.make_rect(GRATE_WIDTH, GRATE_SLOPE_LENGTH)
+    slot = Wire.make_rect(SLOT_X, SLOT_Y)
+    slots = [slot.moved(loc) for loc in
+             GridLocations(PITCH_X, PITCH_Y, COUNT_X, COUNT_Y).locations]
+    slotted_face = Face(outline, slots)
+    plate = Solid.extrude(slotted_face, (0, 0, -GRATE_THICKNESS))
+
+    # Lay the plate on the slope: local X = across the firebox,
+    # local Y = up the slope toward the rear, top surface on the slope
+    a = atan2(GRATE_RISE, GRATE_RUN)
+    slope_plane = Plane(
+        origin=(0, GRATE_RUN / 2, GRATE_RISE / 2),
+        x_dir=(1, 0, 0),
+        z_dir=(0, -sin(a), cos(a)),
+    )
+    return slope_plane.location * plate
+
+# =============================================================================
+# TROUGH (open-top steel box beneath the grate)
+# =============================================================================
+
+def make_trough():
+    """Welded plate trough with side cheeks carrying the grate edges."""
+    grate_drop = GRATE_THICKNESS / cos(atan2(GRATE_RISE, GRATE_RUN))
+
+    with BuildPart() as trough:
+        # Outer shell, top flush with hearth level
+        with Locations((0, GRATE_RUN / 2, -TROUGH_HEIGHT / 2)):
+            Box(TROUGH_WIDTH, GRATE_RUN + 2 * PLATE_THICKNESS, TROUGH_HEIGHT)
+        # Hollow it out, leaving walls and floor (open top)
+        with Locations((0, GRATE_RUN / 2, -TROUGH_HEIGHT / 2 + PLATE_THICKNESS)):
+            Box(GRATE_WIDTH, GRATE_RUN, TROUGH_HEIGHT, mode=Mode.SUBTRACT)
+        # Drain opening through the floor
+        with Locations((0, GRATE_RUN / 2, -TROUGH_HEIGHT + PLATE_THICKNESS / 2)):
+            Box(DRAIN_WIDTH, DRAIN_DEPTH, PLATE_THICKNESS * 2, mode=Mode.SUBTRACT)
+
+        # Side cheeks inside each wall: triangles under the grate edges,
+        # from hearth level at the front up to the back wall
+        with BuildSketch(Plane.YZ.offset(-GRATE_WIDTH / 2),
+                         Plane.YZ.offset(GRATE_WIDTH / 2 - PLATE_THICKNESS)):
+            Polygon(
+                (0, -grate_drop),
+                (GRATE_RUN, -grate_drop),
+                (GRATE_RUN, GRATE_RISE - grate_drop),
+                align=None,
+            )
+        extrude(amount=PLATE_THICKNESS)
+
+    return trough.part
+
+# =============================================================================
+# ASH TRAY (removable, below the drain)
+# =============================================================================
+
+def make_tray():
+    """Open-top tray sized to catch everything through the drain."""
+    tray_w = DRAIN_WIDTH + 2 * TRAY_MARGIN
+    tray_d = DRAIN_DEPTH + 2 * TRAY_MARGIN
+    tray_top = -TROUGH_HEIGHT - TRAY_GAP
+
+    with BuildPart() as tray:
+        with Locations((0, GRATE_RUN / 2, tray_top - TRAY_HEIGHT / 2)):
+            Box(tray_w, tray_d, TRAY_HEIGHT)
+        with Locations((0, GRATE_RUN / 2, tray_top - TRAY_HEIGHT / 2 + PLATE_THICKNESS)):
+            Box(tray_w - 2 * PLATE_THICKNESS, tray_d - 2 * PLATE_THICKNESS,
+                TRAY_HEIGHT, mode=Mode.SUBTRACT)
+
+    return tray.part
+
+# =============================================================================
+# BUILD
+# =============================================================================
+
+t0 = time.perf_counter()
+grate = make_grate()
+grate_seconds = time.perf_counter() - t0
+
+trough = make_trough()
+tray = make_tray()
+
+# =============================================================================
+# DISPLAY ASSEMBLY
+# =============================================================================
+
+show_object(grate, name="Angled Grate", options={"color": (45, 45, 50)})
+show_object(trough, name="Trough + Side Cheeks (3/16\" plate)", options={"color": (110, 110, 120)})
+show_object(tray, name="Ash Tray", options={"color": (150, 90, 60), "alpha": 0.6})
+
+# =============================================================================
+# OUTPUT SUMMARY
+# =============================================================================
+
+trough_volume = GRATE_WIDTH * GRATE_RUN * (TROUGH_HEIGHT - PLATE_THICKNESS)
+
+print(f"""
+================================================================================
+REAR ASH GRATE + TROUGH
+================================================================================
+
+  GRATE:
+    - Width:  {GRATE_WIDTH/INCH:.2f}"   Run: {GRATE_RUN/INCH:.2f}"   Rise: {GRATE_RISE/INCH:.2f}"
+    - Slope:  {GRATE_ANGLE:.1f}° ({GRATE_SLOPE_LENGTH/INCH:.2f}" along the slope)
+    - Bars:   {BAR_ORIENTATION.replace("_", "-")}, {BAR_WIDTH/INCH:.3f}" wide, {SLOT_GAP/INCH:.3f}" gap
+    - Openings: {COUNT_X} x {COUNT_Y} = {OPENING_COUNT}
+                ({SLOT_X/INCH:.3f}" x {SLOT_Y/INCH:.3f}" each)
+    - Built in {grate_seconds:.2f} s (single slotted-face extrude)
+
+  TROUGH:
+    - Inside: {GRATE_WIDTH/INCH:.2f}" x {GRATE_RUN/INCH:.2f}" x {(TROUGH_HEIGHT - PLATE_THICKNESS)/INCH:.2f}" deep
+    - Volume: ~{trough_volume / INCH**3:.0f} cubic inches
+    - Drain:  {DRAIN_WIDTH/INCH:.1f}" x {DRAIN_DEPTH/INCH:.1f}" (centered in floor)
+
+  TRAY:
+    - {(DRAIN_WIDTH + 2*TRAY_MARGIN)/INCH:.1f}" x {(DRAIN_DEPTH + 2*TRAY_MARGIN)/INCH:.1f}" x {TRAY_HEIGHT/INCH:.1f}"
+
+================================================================================
+""")
+
+# =============================================================================
+# EXPORT (uncomment to generate files)
+# =============================================================================
+
+# grate.export_step("ash_grate.step")
+# trough.export_step("ash_trough.step")
@@ -0,0 +1,112 @@
+"""
+Golden Fingerprint Check for All Models
+=======================================
+
+Rebuilds every model script in cad/, fingerprints each part it shows and
+compares against fingerprints.json. Run after refactoring shared helpers
+(make_arc_section, make_tapered_arc, grinder mount parts, ...) to confirm
+the geometry did not move.
+
+    python check_fingerprints.py              # check all models
+    python check_fingerprints.py taper_demo   # check one model
+    python check_fingerprints.py --update     # accept current geometry
+
+Exit status is 1 if any part changed, disappeared or is new.
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+
+from fingerprint import compare, fingerprint
+from model_capture import capture_model
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+GOLDEN_PATH = os.path.join(HERE, "fingerprints.json")
+
+# Every model script that shows geometry. view_polycam_scan.py is left
+# out: it needs a scan file that is not kept in the repo.
+MODELS = [
+    "verify_install.py",
+    "corner_post_counter_to_mantel.py",
+    "taper_demo.py",
+    "taper_demo_strips.py",
+    "grinder_mount.py",
+    "ash_grate.py",
+    "cutting_sled.py",
+]
+
+
+def fingerprint_model(script):
+    """Return {part name: fingerprint} for one model script."""
+    parts = capture_model(os.path.join(HERE, script))
+    return {part["name"]: fingerprint(part["shape"]) for part in parts}
+
+
+def check_model(script, expected, actual):
+    """Return a list of problem lines for one model."""
+    problems = []
+    for name in expected:
+        if name not in actual:
+            problems.append(f"  {name}: missing")
+    for name, fp in actual.items():
+        if name not in expected:
+            problems.append(f"  {name}: new part (no golden fingerprint)")
+            continue
+        problems.extend(f"  {name}: {diff}" for diff in compare(expected[name], fp))
+    return problems
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("models", nargs="*",
+                        help="model scripts to check (default: all)")
+    parser.add_argument("--update", action="store_true",
+                        help="write current fingerprints to fingerprints.json")
+    args = parser.parse_args(argv)
+
+    selected = [m if m.endswith(".py") else m + ".py" for m in args.models] or MODELS
+    unknown = [m for m in selected if m not in MODELS]
+    if unknown:
+        parser.error(f"unknown model(s): {', '.join(unknown)}")
+
+    golden = {}
+    if os.path.exists(GOLDEN_PATH):
+        with open(GOLDEN_PATH) as f:
+            golden = json.load(f)
+
+    failed = False
+    for script in selected:
+        t0 = time.perf_counter()
+        actual = fingerprint_model(script)
+        seconds = time.perf_counter() - t0
+
+        if args.update:
+            golden[script] = actual
+            print(f"{script}: {len(actual)} parts recorded ({seconds:.1f} s)")
+            continue
+
+        if script not in golden:
+            print(f"{script}: NO GOLDEN — run with --update")
+            failed = True
+            continue
+
+        problems = check_model(script, golden[script], actual)
+        status = "CHANGED" if problems else "ok"
+        print(f"{script}: {status}, {len(actual)} parts ({seconds:.1f} s)")
+        for line in problems:
+            print(line)
+        failed = failed or bool(problems)
+
+    if args.update:
+        with open(GOLDEN_PATH, "w") as f:
+            json.dump(golden, f, indent=2, sort_keys=True)
+            f.write("\n")
+        return 0
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -4,6 +4,7 @@
 from build123d import *
 from ocp_vscode import show
 from math import cos, sin, radians, pi
+from strip_flat_pattern import make_strip_solids
 
 # === UNITS ===
 INCH = 25.4  # mm
@@ -64,8 +65,15 @@ def make_arc_section(height, outer_radius, z_offset):
     return section.part
 
 # %% Helper: create individual strips for a tier
-def make_tier_with_strips(height, outer_radius, z_offset):
-    """Create a tier as individual strip segments"""
+def make_tier_with_strips(height, outer_radius, z_offset, top_radius=None):
+    """Create a tier as individual strip segments
+
+    With top_radius, the tier tapers from outer_radius (bottom) to
+    top_radius, built as flat trapezoid facets from strip_flat_pattern.
+    """
+    if top_radius is not None:
+        return make_tapered_strips(height, outer_radius, top_radius, z_offset)
+
     inner_radius = outer_radius - TILE_THICKNESS
     strips = []
 
@@ -117,6 +125,12 @@ def make_tier_with_strips(height, outer_radius, z_offset):
 
     return strips
 
+# %% Helper: tapered tier as flat trapezoid strips
+def make_tapered_strips(height, bottom_radius, top_radius, z_offset):
+    """Flat tile strips for a tapered tier (see strip_flat_pattern.make_strip_solids)."""
+    return make_strip_solids(height, bottom_radius, top_radius, z_offset,
+                             STRIP_COUNT, ARC_ANGLE, GROUT_GAP, TILE_THICKNESS)
+
 # %% Build the tapered post
 parts = []
 colors = []
@@ -0,0 +1,186 @@
+"""
+Geometry Fingerprints — Cheap, Stable Change Detection for Parts
+================================================================
+
+A fingerprint summarizes a part in a few numbers plus one hash:
+
+- volume, surface area, bounding box
+- solid / face / edge / vertex counts
+- moments of sampled surface points: every vertex, points along every
+  edge (quarter/half/three-quarter of its arc length) and every face's
+  area centroid; their mean and second central moments
+- a hash of the same points rounded to POINT_PRECISION and sorted
+
+The sample points depend only on the geometry, not on the order the
+kernel lists faces and edges or how an edge is parameterized, so a
+refactor that rebuilds the same shape a different way keeps the same
+fingerprint.
+
+All measured values, the point moments included, are compared with
+REL_TOL / ABS_TOL. The hash is only a fast path: rounding can flip a
+value that sits on a rounding boundary (3.175 mm is common here), so a
+different hash alone never counts as a change.
+
+Usage:
+    from fingerprint import fingerprint, compare, digest, export_if_changed
+
+    fp = fingerprint(part)
+    problems = compare(stored_fp, fp)     # [] when unchanged
+    export_if_changed(part, "base.step")  # skips the export if unchanged
+
+Golden checks for every model: see check_fingerprints.py.
+"""
+
+import hashlib
+import json
+import math
+import os
+
+from build123d import PositionMode
+
+# Decimal places (mm) kept for sample points before hashing
+POINT_PRECISION = 2
+
+# Comparison tolerances for the measured quantities
+REL_TOL = 1e-6
+ABS_TOL = 1e-3  # mm, mm², mm³
+
+# Fractions along each edge (by length) used as sample points
+EDGE_SAMPLES = (0.25, 0.5, 0.75)
+
+
+def sample_points(shape):
+    """Surface sample points of `shape` as (x, y, z) tuples, unrounded."""
+    points = [v.center() for v in shape.vertices()]
+    for edge in shape.edges():
+        points.extend(edge.position_at(t, position_mode=PositionMode.LENGTH)
+                      for t in EDGE_SAMPLES)
+    points.extend(face.center() for face in shape.faces())
+    return [(p.X, p.Y, p.Z) for p in points]
+
+
+def point_moments(points):
+    """Mean (x, y, z) and second central moments (xx, yy, zz, xy, xz, yz)."""
+    n = len(points)
+    mean = [sum(p[i] for p in points) / n for i in range(3)]
+    d = [[p[i] - mean[i] for i in range(3)] for p in points]
+    pairs = ((0, 0), (1, 1), (2, 2), (0, 1), (0, 2), (1, 2))
+    second = [sum(q[i] * q[j] for q in d) / n for i, j in pairs]
+    return mean + second
+
+
+def _point_hash(points, precision):
+    # +0.0 folds -0.0 into 0.0 so mirrored zeros hash the same
+    rounded = sorted(tuple(round(c, precision) + 0.0 for c in p) for p in points)
+    return hashlib.sha256(repr(rounded).encode()).hexdigest()[:16]
+
+
+def fingerprint(shape, precision=POINT_PRECISION):
+    """Return the fingerprint of `shape` as a JSON-serializable dict."""
+    bb = shape.bounding_box()
+    points = sample_points(shape)
+
+    return {
+        "volume": round(shape.volume, 4),
+        "area": round(shape.area, 4),
+        "bbox": [round(c, 4) + 0.0 for c in (bb.min.X, bb.min.Y, bb.min.Z,
+                                             bb.max.X, bb.max.Y, bb.max.Z)],
+        "solids": len(shape.solids()),
+        "faces": len(shape.faces()),
+        "edges": len(shape.edges()),
+        "vertices": len(shape.vertices()),
+        "point_moments": [round(m, 6) + 0.0 for m in point_moments(points)],
+        "points": _point_hash(points, precision),
+    }
+
+
+def _close(a, b):
+    return math.isclose(a, b, rel_tol=REL_TOL, abs_tol=ABS_TOL)
+
+
+def compare(expected, actual):
+    """List the differences between two fingerprints ([] if they match).
+
+    Measured values are compared with tolerances; the point hash is not
+    compared at all (see the module docstring).
+    """
+    if expected == actual:
+        return []
+    problems = []
+    for key in ("volume", "area"):
+        if not _close(expected[key], actual[key]):
+            problems.append(f"{key}: {expected[key]} → {actual[key]}")
+    for key in ("bbox", "point_moments"):
+        if not all(_close(a, b) for a, b in zip(expected[key], actual[key])):
+            problems.append(f"{key}: {expected[key]} → {actual[key]}")
+    for key in ("solids", "faces", "edges", "vertices"):
+        if expected[key] != actual[key]:
+            problems.append(f"{key}: {expected[key]} → {actual[key]}")
+    return problems
+
+
+def digest(fp):
+    """Short hash of a whole fingerprint.
+
+    Equal digests mean equal fingerprints; different digests do not mean
+    a change, so use compare() for that.
+    """
+    return hashlib.sha256(json.dumps(fp, sort_keys=True).encode()).hexdigest()[:16]
+
+
+# =============================================================================
+# CHANGE DETECTION
+# =============================================================================
+
+def has_changed(key, shape, cache_path):
+    """True if `shape` differs from the last shape recorded under `key`.
+
+    The cache is a small JSON file of {key: fingerprint}, compared with
+    compare(); it is updated as a side effect when the shape changed. Use
+    it to skip downstream work (exports, renders, sled clearance checks)
+    when an upstream part came out identical.
+    """
+    cache = {}
+    if os.path.exists(cache_path):
+        with open(cache_path) as f:
+            cache = json.load(f)
+    new = fingerprint(shape)
+    if key in cache and not compare(cache[key], new):
+        return False
+    cache[key] = new
+    with open(cache_path, "w") as f:
+        json.dump(cache, f, indent=2, sort_keys=True)
+    return True
+
+
+def export_if_changed(shape, path, export=None):
+    """Export `shape` to `path` unless an identical shape is already there.
+
+    The fingerprint is kept in a JSON sidecar file `<path>.fp`.
+    `export(shape, path)` defaults to build123d's STEP/STL exporter chosen
+    by file extension. Returns True if the file was written.
+    """
+    sidecar = path + ".fp"
+    new = fingerprint(shape)
+    if os.path.exists(path) and os.path.exists(sidecar):
+        with open(sidecar) as f:
+            try:
+                old = json.load(f)
+            except json.JSONDecodeError:
+                old = None
+        if isinstance(old, dict) and not compare(old, new):
+            return False
+
+    if export is None:
+        from build123d import export_step, export_stl
+        ext = os.path.splitext(path)[1].lower()
+        exporters = {".step": export_step, ".stp": export_step, ".stl": export_stl}
+        if ext not in exporters:
+            raise ValueError(f"No default exporter for {ext!r}; pass export=")
+        export = exporters[ext]
+
+    export(shape, path)
+    with open(sidecar, "w") as f:
+        json.dump(new, f, indent=2, sort_keys=True)
+        f.write("\n")
+    return True
@@ -292,17 +292,19 @@ bolt_right = mirror(bolt_left, about=Plane.XZ)
 # DISPLAY ASSEMBLY
 # =============================================================================
 
-show_object(base, name="Base Plate (1/4\" steel)", options={"color": (70, 70, 80)})
-show_object(left_bracket, name="L-Bracket Left", options={"color": (90, 90, 100)})
-show_object(right_bracket, name="L-Bracket Right", options={"color": (90, 90, 100)})
-show_object(shaft_collar, name="Shaft Collar Brace", options={"color": (85, 85, 95)})
-
-# Reference geometry (semi-transparent)
-show_object(gear_head, name="Grinder Gear Head (ref)", options={"color": (40, 120, 40), "alpha": 0.4})
-show_object(motor_body, name="Grinder Motor Body (ref)", options={"color": (50, 50, 60), "alpha": 0.3})
-show_object(blade, name="Blade (ref)", options={"color": (180, 50, 50), "alpha": 0.4})
-show_object(bolt_left, name="M10 Bolt Left", options={"color": (30, 30, 35)})
-show_object(bolt_right, name="M10 Bolt Right", options={"color": (30, 30, 35)})
+# Only when run directly — cutting_sled.py imports these parts
+if __name__ == "__main__":
+    show_object(base, name="Base Plate (1/4\" steel)", options={"color": (70, 70, 80)})
+    show_object(left_bracket, name="L-Bracket Left", options={"color": (90, 90, 100)})
+    show_object(right_bracket, name="L-Bracket Right", options={"color": (90, 90, 100)})
+    show_object(shaft_collar, name="Shaft Collar Brace", options={"color": (85, 85, 95)})
+
+    # Reference geometry (semi-transparent)
+    show_object(gear_head, name="Grinder Gear Head (ref)", options={"color": (40, 120, 40), "alpha": 0.4})
+    show_object(motor_body, name="Grinder Motor Body (ref)", options={"color": (50, 50, 60), "alpha": 0.3})
+    show_object(blade, name="Blade (ref)", options={"color": (180, 50, 50), "alpha": 0.4})
+    show_object(bolt_left, name="M10 Bolt Left", options={"color": (30, 30, 35)})
+    show_object(bolt_right, name="M10 Bolt Right", options={"color": (30, 30, 35)})
 
 # =============================================================================
 # OUTPUT SUMMARY
@@ -311,7 +313,7 @@ show_object(bolt_right, name="M10 Bolt Right", options={"color": (30, 30, 35)})
 blade_bottom = BLADE_CENTER_Z - BLADE_DIA/2
 blade_below_base = -blade_bottom if blade_bottom < 0 else 0
 
-print(f"""
+SUMMARY = f"""
 ================================================================================
 GRINDER MOUNT ASSEMBLY — Precision Cutting Sled
 ================================================================================
@@ -383,7 +385,10 @@ CRITICAL: MEASURE YOUR GRINDER BEFORE FABRICATION!
 
 Update parameters, re-run script (Shift+Enter), verify fit in viewer.
 ================================================================================
-""")
+"""
+
+if __name__ == "__main__":
+    print(SUMMARY)
 
 # =============================================================================
 # EXPORT (uncomment to generate files)
@@ -0,0 +1,193 @@
+"""
+Model Capture — Run a Model Script Without the Viewer
+=====================================================
+
+Runs one of the cad/ model scripts and records every part it sends to
+OCP CAD Viewer, with the name, color and alpha the script assigns. Used
+by tools that need the finished geometry in bulk (fingerprint checks,
+batch exports) instead of in the viewer.
+
+While the script runs, `ocp_vscode` is replaced by a recorder module, so
+captures work the same whether or not the viewer extension is running.
+
+Top-level parameters can be overridden for a run, which is how parameter
+sweeps rebuild a script without editing it, and read without running the
+script at all, so other tools can share a script's dimensions.
+
+Usage:
+    from model_capture import capture_model
+
+    for part in capture_model("grinder_mount.py"):
+        print(part["name"], part["color"], part["shape"].volume)
+
+    # Same script with a bigger blade ("125" or "5 * INCH" also accepted)
+    parts = capture_model("grinder_mount.py", overrides={"BLADE_DIA": 125.0})
+
+    # Numeric parameters only, nothing is built
+    params = script_parameters("taper_demo.py")   # {"INCH": 25.4, ...}
+"""
+
+import ast
+import builtins
+import contextlib
+import io
+import os
+import sys
+import types
+
+
+def _as_shape(obj):
+    """Unwrap builder objects (BuildPart, BuildSketch, ...) to their shape."""
+    for attr in ("part", "sketch", "line"):
+        shape = getattr(obj, attr, None)
+        if shape is not None and not callable(shape):
+            return shape
+    return obj
+
+
+class _Recorder:
+    """Collects show()/show_object() calls in the order they are made."""
+
+    def __init__(self):
+        self.parts = []
+
+    def add(self, obj, name=None, color=None, alpha=1.0):
+        if name is None:
+            name = f"Part {len(self.parts) + 1}"
+        self.parts.append({
+            "name": name,
+            "shape": _as_shape(obj),
+            "color": color,
+            "alpha": 1.0 if alpha is None else alpha,
+        })
+
+    def show(self, *objs, names=None, colors=None, alphas=None, **kwargs):
+        for i, obj in enumerate(objs):
+            self.add(
+                obj,
+                name=names[i] if names and i < len(names) else None,
+                color=colors[i] if colors and i < len(colors) else None,
+                alpha=alphas[i] if alphas and i < len(alphas) else 1.0,
+            )
+
+    def show_object(self, obj, name=None, options=None, **kwargs):
+        options = options or {}
+        self.add(obj, name=name, color=options.get("color"),
+                 alpha=options.get("alpha", 1.0))
+
+    def module(self):
+        """A stand-in for the ocp_vscode module that records instead."""
+        module = types.ModuleType("ocp_vscode")
+        module.show = self.show
+        module.show_object = self.show_object
+        module.show_all = lambda *args, **kwargs: None
+        module.set_defaults = lambda *args, **kwargs: None
+        module.Camera = types.SimpleNamespace(KEEP="keep", RESET="reset", CENTER="center")
+        return module
+
+
+def _unique_names(parts):
+    """Suffix repeated part names with #2, #3, ... so they can be keys."""
+    seen = {}
+    for part in parts:
+        base = part["name"]
+        seen[base] = seen.get(base, 0) + 1
+        if seen[base] > 1:
+            part["name"] = f"{base} #{seen[base]}"
+    return parts
+
+
+def _apply_overrides(tree, overrides, script_path):
+    """Replace the values of top-level `NAME = ...` assignments in place.
+
+    Numbers become constants; strings are parsed as Python expressions and
+    evaluated in the script, so "2.0 * INCH" works.
+    """
+    remaining = dict(overrides)
+    for node in tree.body:
+        if (isinstance(node, ast.Assign) and len(node.targets) == 1
+                and isinstance(node.targets[0], ast.Name)
+                and node.targets[0].id in remaining):
+            value = remaining.pop(node.targets[0].id)
+            if isinstance(value, str):
+                node.value = ast.parse(value, mode="eval").body
+            else:
+                node.value = ast.Constant(value)
+    if remaining:
+        raise ValueError(f"{os.path.basename(script_path)} has no top-level "
+                         f"parameter(s): {', '.join(sorted(remaining))}")
+    return ast.fix_missing_locations(tree)
+
+
+# AST nodes allowed in a parameter expression: numbers, names, + - * / ** etc.
+_ARITHMETIC = (ast.Expression, ast.Constant, ast.Name, ast.Load,
+               ast.BinOp, ast.UnaryOp, ast.operator, ast.unaryop)
+
+
+def script_parameters(script_path):
+    """Top-level numeric parameters of a model script, without running it.
+
+    Evaluates `NAME = <arithmetic>` assignments in file order, where the
+    expression uses only numbers, earlier parameters and arithmetic
+    operators. Anything else (calls, tuples, geometry) is skipped.
+    Returns {NAME: value}.
+    """
+    with open(script_path) as f:
+        tree = ast.parse(f.read(), filename=script_path)
+
+    params = {}
+    for node in tree.body:
+        if not (isinstance(node, ast.Assign) and len(node.targets) == 1
+                and isinstance(node.targets[0], ast.Name)):
+            continue
+        expr = ast.Expression(node.value)
+        if not all(isinstance(n, _ARITHMETIC) for n in ast.walk(expr)):
+            continue
+        try:
+            value = eval(compile(expr, script_path, "eval"), {"__builtins__": {}}, dict(params))
+        except (NameError, ArithmeticError, TypeError):
+            continue
+        if isinstance(value, (int, float)):
+            params[node.targets[0].id] = value
+    return params
+
+
+def capture_model(script_path, overrides=None, quiet=True):
+    """Run a model script and return the parts it shows.
+
+    Args:
+        script_path: path to a cad/ model script
+        overrides: {PARAMETER: value} replacing top-level assignments
+        quiet: suppress the script's printed output
+
+    Returns a list of dicts with keys "name", "shape", "color", "alpha".
+    Colors are whatever the script passed: a CSS color name, an RGB tuple
+    (0-255), or None.
+    """
+    script_path = os.path.abspath(script_path)
+    script_dir = os.path.dirname(script_path)
+    recorder = _Recorder()
+
+    with open(script_path) as f:
+        tree = ast.parse(f.read(), filename=script_path)
+    if overrides:
+        tree = _apply_overrides(tree, overrides, script_path)
+    code = compile(tree, script_path, "exec")
+    namespace = {"__name__": "__main__", "__file__": script_path,
+                 "__builtins__": builtins}
+
+    saved_viewer = sys.modules.get("ocp_vscode")
+    sys.modules["ocp_vscode"] = recorder.module()
+    sys.path.insert(0, script_dir)
+    output = io.StringIO() if quiet else None
+    try:
+        with contextlib.redirect_stdout(output) if quiet else contextlib.nullcontext():
+            exec(code, namespace)
+    finally:
+        sys.path.remove(script_dir)
+        if saved_viewer is None:
+            sys.modules.pop("ocp_vscode", None)
+        else:
+            sys.modules["ocp_vscode"] = saved_viewer
+
+    return _unique_names(recorder.parts)
@@ -0,0 +1,403 @@
+"""
+Polycam OBJ Loader — Streaming Geometry, Lazy Downsampled Texture
+=================================================================
+
+Loads a textured Polycam OBJ export for visual context next to the
+precision models (see docs/polycam-integration.md).
+
+- Geometry is parsed in fixed-size chunks straight into NumPy arrays
+  (float32 positions/UVs, int32 triangles); the file is never held in
+  memory as a whole or as Python tuples.
+- The texture atlas is NOT read at load time. `scan.texture.image(level)`
+  decodes it on first use at mip level `level` (each level halves width
+  and height). JPEG atlases are downscaled inside the decoder, so a
+  level-3 image never allocates the full-resolution bitmap.
+
+Usage:
+    from polycam_obj import load_obj
+
+    scan = load_obj("../polycam/corner.obj")
+    face = scan.to_face()                  # build123d Face for show()
+    rgb = scan.texture.image(level=3)      # (H/8, W/8, 3) uint8, cached
+
+    # Texture baked to per-triangle colors, one Face per color group
+    for color, triangles in scan.color_groups(level=3):
+        show(scan.to_face(triangles), colors=[color])
+"""
+
+import array
+import os
+import tempfile
+
+import numpy as np
+
+# Pillow is only needed once a texture is actually decoded
+try:
+    from PIL import Image
+    HAS_PIL = True
+except ImportError:
+    HAS_PIL = False
+
+# Bytes read per chunk while streaming the OBJ file
+CHUNK_SIZE = 16 * 1024 * 1024
+
+
+# =============================================================================
+# LAZY TEXTURE
+# =============================================================================
+
+class LazyTexture:
+    """Texture atlas decoded on demand at a chosen mip level.
+
+    Level 0 is full resolution; level n is 1/2**n in each dimension.
+    Decoded levels are cached; call `release()` to drop them.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self._levels = {}
+        self._size = None
+
+    @property
+    def size(self):
+        """Full-resolution (width, height), read from the file header only."""
+        if self._size is None:
+            self._require_pil()
+            with Image.open(self.path) as img:
+                self._size = img.size
+        return self._size
+
+    def image(self, level=2):
+        """Return the texture as an (H, W, 3) uint8 array at mip `level`."""
+        if level not in self._levels:
+            self._levels[level] = self._decode(level)
+        return self._levels[level]
+
+    def mean_color(self, level=5):
+        """Average RGB (0-255 ints) from a small mip level."""
+        rgb = self.image(level).reshape(-1, 3).mean(axis=0)
+        return tuple(int(round(c)) for c in rgb)
+
+    def release(self):
+        """Drop all decoded levels."""
+        self._levels.clear()
+
+    def _decode(self, level):
+        self._require_pil()
+        with Image.open(self.path) as img:
+            w, h = img.size
+            target = (max(1, w >> level), max(1, h >> level))
+            # JPEG: let the decoder do power-of-two DCT scaling (up to 1/8)
+            img.draft("RGB", target)
+            img = img.convert("RGB")
+            # Finish any remaining reduction with a box filter
+            factor = max(1, min(img.size[0] // target[0], img.size[1] // target[1]))
+            if factor > 1:
+                img = img.reduce(factor)
+            if img.size != target:
+                img = img.resize(target, Image.BOX)
+            return np.asarray(img, dtype=np.uint8)
+
+    @staticmethod
+    def _require_pil():
+        if not HAS_PIL:
+            raise ImportError("Texture decoding needs Pillow: pip install pillow")
+
+    def __repr__(self):
+        return f"LazyTexture({os.path.basename(self.path)!r}, levels={sorted(self._levels)})"
+
+
+# =============================================================================
+# SCAN CONTAINER
+# =============================================================================
+
+class ObjScan:
+    """Triangle mesh from an OBJ file.
+
+    Attributes:
+        vertices:  (N, 3) float32 positions
+        faces:     (M, 3) int32 vertex indices (0-based, triangulated)
+        uvs:       (K, 2) float32 texture coordinates, or None
+        face_uvs:  (M, 3) int32 UV indices per triangle corner, or None
+        texture:   LazyTexture for the material's map_Kd, or None
+    """
+
+    def __init__(self, vertices, faces, uvs=None, face_uvs=None, texture=None):
+        self.vertices = vertices
+        self.faces = faces
+        self.uvs = uvs
+        self.face_uvs = face_uvs
+        self.texture = texture
+
+    @property
+    def nbytes(self):
+        """Memory held by the geometry arrays (texture levels not included)."""
+        arrays = (self.vertices, self.faces, self.uvs, self.face_uvs)
+        return sum(a.nbytes for a in arrays if a is not None)
+
+    def bounding_box(self):
+        """(min_xyz, max_xyz) of the vertices."""
+        return self.vertices.min(axis=0), self.vertices.max(axis=0)
+
+    def to_face(self, triangles=None):
+        """Return the mesh (or the `triangles` subset) as a build123d Face.
+
+        The triangles are written to a temporary binary STL with NumPy and
+        read back by OpenCascade's native reader, which is far faster than
+        building the triangulation node by node from Python.
+        """
+        from build123d import import_stl
+
+        faces = self.faces if triangles is None else self.faces[triangles]
+        fd, stl_path = tempfile.mkstemp(suffix=".stl")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                write_binary_stl(f, self.vertices, faces)
+            return import_stl(stl_path)
+        finally:
+            os.remove(stl_path)
+
+    def triangle_colors(self, level=3):
+        """Texture color at each triangle's UV centroid, (M, 3) uint8.
+
+        Sampled (nearest texel) from the mip `level` image, so only that
+        level is ever decoded.
+        """
+        if self.texture is None or self.face_uvs is None:
+            raise ValueError("Scan has no texture or no texture coordinates")
+        rgb = self.texture.image(level)
+        h, w = rgb.shape[:2]
+        uv = np.clip(self.uvs[self.face_uvs].mean(axis=1), 0.0, 1.0)
+        cols = np.minimum((uv[:, 0] * w).astype(np.int64), w - 1)
+        rows = np.minimum(((1.0 - uv[:, 1]) * h).astype(np.int64), h - 1)  # v up
+        return rgb[rows, cols]
+
+    def color_groups(self, level=3, steps=4):
+        """Triangles grouped by texture color, for viewers with one color per object.
+
+        Each channel is quantized to `steps` levels. Returns a list of
+        (rgb, triangle indices), rgb being the group's mean color, largest
+        group first.
+        """
+        colors = self.triangle_colors(level)
+        q = colors.astype(np.int64) * steps // 256
+        keys = (q[:, 0] * steps + q[:, 1]) * steps + q[:, 2]
+        order = np.argsort(keys, kind="stable")
+        _, starts, counts = np.unique(keys[order], return_index=True, return_counts=True)
+        groups = []
+        for start, count in zip(starts, counts):
+            idx = order[start:start + count]
+            mean = colors[idx].mean(axis=0)
+            groups.append((tuple(int(round(c)) for c in mean), idx))
+        groups.sort(key=lambda group: -len(group[1]))
+        return groups
+
+    def __repr__(self):
+        return (f"ObjScan({len(self.vertices)} vertices, {len(self.faces)} triangles, "
+                f"texture={self.texture!r})")
+
+
+def write_binary_stl(f, vertices, faces):
+    """Write triangles to an open binary file as STL (normals left zero)."""
+    record = np.dtype([("normal", "<f4", 3), ("tri", "<f4", (3, 3)), ("attr", "<u2")])
+    data = np.zeros(len(faces), dtype=record)
+    data["tri"] = vertices[faces]
+    f.write(b"\0" * 80)
+    f.write(np.uint32(len(faces)).tobytes())
+    f.write(data.tobytes())
+
+
+# =============================================================================
+# STREAMING PARSER
+# =============================================================================
+
+def _iter_lines(path):
+    """Yield lists of complete lines, CHUNK_SIZE bytes at a time."""
+    tail = b""
+    with open(path, "rb") as f:
+        while True:
+            block = f.read(CHUNK_SIZE)
+            if not block:
+                break
+            lines = (tail + block).split(b"\n")
+            tail = lines.pop()
+            yield lines
+    if tail:
+        yield [tail]
+
+
+def _parse_floats(lines, columns):
+    """Parse 'v'/'vt' lines into an (n, columns) float32 array.
+
+    Extra per-line values (e.g. vertex colors, w) are dropped.
+    """
+    width = len(lines[0].split()) - 1
+    values = np.array(b" ".join(line.split(None, 1)[1] for line in lines).split(),
+                      dtype=np.float32)
+    if values.size == width * len(lines):
+        return np.ascontiguousarray(values.reshape(-1, width)[:, :columns])
+    # Ragged lines: fall back to one line at a time
+    return np.array([line.split()[1:columns + 1] for line in lines], dtype=np.float32)
+
+
+def _face_layout(token):
+    """Return (ints per corner, uv column or None) for an OBJ face token."""
+    parts = token.split(b"/")
+    uv_column = 1 if len(parts) > 1 and parts[1] else None
+    return sum(1 for p in parts if p), uv_column
+
+
+def _line_layout(line):
+    """(spaces, slashes, empty fields) of a face line: equal for equal layouts."""
+    line = line.strip()
+    return line.count(b" "), line.count(b"/"), line.count(b"//")
+
+
+def _parse_faces_fast(lines):
+    """Vectorized path: every line has the same corner count and layout.
+
+    Returns (faces, face_uvs) or None if the chunk needs the slow path.
+    """
+    first = lines[0].split()
+    corners = len(first) - 1
+    per_corner, uv_column = _face_layout(first[1])
+    # Every line must share the first line's layout, e.g. "a/b" and "a//n"
+    # have the same number of ints but mean different things
+    layout = _line_layout(lines[0])
+    if any(_line_layout(line) != layout for line in lines):
+        return None
+
+    ints = np.array(
+        b" ".join(line.split(None, 1)[1] for line in lines).replace(b"/", b" ").split(),
+        dtype=np.int64,
+    )
+    if ints.size != len(lines) * corners * per_corner or (ints < 0).any():
+        return None
+
+    table = ints.reshape(len(lines), corners, per_corner) - 1
+    positions = table[:, :, 0]
+    uv_index = table[:, :, uv_column] if uv_column is not None else None
+    return _fan(positions), (_fan(uv_index) if uv_index is not None else None)
+
+
+def _parse_faces_slow(lines, vertex_counts, uv_counts):
+    """Per-line path: mixed polygon sizes, negative (relative) indices.
+
+    `vertex_counts` / `uv_counts` hold the number of v / vt lines read
+    before each face line, which is what a relative index counts back from.
+    """
+    faces = array.array("i")
+    face_uvs = array.array("i")
+    has_uv = True
+    for line, vertex_count, uv_count in zip(lines, vertex_counts, uv_counts):
+        corners = line.split()[1:]
+        v_idx, t_idx = [], []
+        for token in corners:
+            parts = token.split(b"/")
+            v = int(parts[0])
+            v_idx.append(v - 1 if v > 0 else vertex_count + v)
+            if len(parts) > 1 and parts[1]:
+                t = int(parts[1])
+                t_idx.append(t - 1 if t > 0 else uv_count + t)
+            else:
+                has_uv = False
+        for i in range(1, len(v_idx) - 1):
+            faces.extend((v_idx[0], v_idx[i], v_idx[i + 1]))
+            if has_uv:
+                face_uvs.extend((t_idx[0], t_idx[i], t_idx[i + 1]))
+    faces = np.frombuffer(faces, dtype=np.int32).reshape(-1, 3)
+    face_uvs = np.frombuffer(face_uvs, dtype=np.int32).reshape(-1, 3) if has_uv else None
+    return faces, face_uvs
+
+
+def _fan(corners):
+    """Fan-triangulate an (n, k) corner index array into (n*(k-2), 3) int32."""
+    k = corners.shape[1]
+    if k == 3:
+        return corners.astype(np.int32)
+    tris = np.stack([
+        np.repeat(corners[:, :1], k - 2, axis=1),
+        corners[:, 1:-1],
+        corners[:, 2:],
+    ], axis=2)
+    return tris.reshape(-1, 3).astype(np.int32)
+
+
+def _find_texture(obj_path, mtllib):
+    """Return the map_Kd path from the OBJ's material library, if any."""
+    if mtllib is None:
+        return None
+    folder = os.path.dirname(obj_path)
+    mtl_path = os.path.join(folder, mtllib)
+    if not os.path.exists(mtl_path):
+        return None
+    with open(mtl_path, "r", errors="replace") as f:
+        for line in f:
+            if line.strip().lower().startswith("map_kd"):
+                # Options (e.g. -s 1 1 1) may precede the file name
+                name = line.split()[-1]
+                texture_path = os.path.join(folder, name)
+                return texture_path if os.path.exists(texture_path) else None
+    return None
+
+
+def load_obj(path, scale=1.0):
+    """Stream an OBJ file into an ObjScan.
+
+    Args:
+        path: OBJ file path
+        scale: multiplier applied to positions (e.g. 1000 for meters → mm)
+
+    The texture (map_Kd from the mtllib) is attached as a LazyTexture and
+    not decoded until requested.
+    """
+    vertex_chunks, uv_chunks = [], []
+    face_chunks, face_uv_chunks = [], []
+    vertex_count = uv_count = 0
+    mtllib = None
+
+    for lines in _iter_lines(path):
+        v_lines, vt_lines, f_lines = [], [], []
+        # Running v / vt totals at each face line, for relative indices
+        f_vertex_counts, f_uv_counts = [], []
+        for line in lines:
+            if line.startswith(b"v "):
+                v_lines.append(line)
+            elif line.startswith(b"vt "):
+                vt_lines.append(line)
+            elif line.startswith(b"f "):
+                f_lines.append(line)
+                f_vertex_counts.append(vertex_count + len(v_lines))
+                f_uv_counts.append(uv_count + len(vt_lines))
+            elif line.startswith(b"mtllib ") and mtllib is None:
+                mtllib = line.split(None, 1)[1].strip().decode("utf-8", "replace")
+
+        if f_lines:
+            parsed = _parse_faces_fast(f_lines)
+            if parsed is None:
+                parsed = _parse_faces_slow(f_lines, f_vertex_counts, f_uv_counts)
+            face_chunks.append(parsed[0])
+            face_uv_chunks.append(parsed[1])
+        if v_lines:
+            vertex_chunks.append(_parse_floats(v_lines, 3))
+            vertex_count += len(v_lines)
+        if vt_lines:
+            uv_chunks.append(_parse_floats(vt_lines, 2))
+            uv_count += len(vt_lines)
+
+    if not vertex_chunks or not face_chunks:
+        raise ValueError(f"No mesh found in {path}")
+
+    vertices = np.concatenate(vertex_chunks)
+    if scale != 1.0:
+        vertices *= np.float32(scale)
+    faces = np.concatenate(face_chunks)
+
+    uvs = face_uvs = None
+    if uv_chunks and all(chunk is not None for chunk in face_uv_chunks):
+        uvs = np.concatenate(uv_chunks)
+        face_uvs = np.concatenate(face_uv_chunks)
+
+    texture_path = _find_texture(path, mtllib)
+    texture = LazyTexture(texture_path) if texture_path else None
+    return ObjScan(vertices, faces, uvs, face_uvs, texture)
@@ -0,0 +1,350 @@
+"""
+Tapered Strip Flat Patterns — Cut Sheets for a Corner Post
+==========================================================
+
+Each tier of the corner post is wrapped in flat tile strips, one facet per
+strip around the 270° arc. When a tier tapers from a bottom radius to a
+top radius, every facet is an isosceles trapezoid ripped from flat tile.
+
+All dimensions are closed-form — no BREP is built or unfolded:
+
+    pitch angle      P  = ARC_ANGLE / n            (one strip + one grout line)
+    face width       w  = 2 r sin(P/2) - grout     (chord at outer radius r)
+    flat length      L  = sqrt(H² + ((R0 - R1) cos(P/2))²)
+    edge taper       δ  = atan(((w0 - w1) / 2) / L) (each long edge)
+    facet tilt       τ  = atan((R0 - R1) cos(P/2) / H)
+    edge bevel       β  = asin(cos τ · sin(P/2))   (= P/2 for a straight tier)
+
+Strip facets sit on the outer radius: facet corners lie on the circle of
+that radius, a grout gap is taken out of each chord, and the facet leans
+in by the facet tilt angle from vertical.
+
+Adjacent facets meet at the pitch angle, so strips ripped with square
+edges close the grout line toward the back by 2 t cos τ tan(P/2). With
+1/4" tile at 30° pitch that is 3.40 mm, more than a 1/8" grout line, so
+the long edges are bevelled by β: each edge face is then parallel to the
+radial plane between two strips and the grout line keeps its width
+through the tile.
+
+The post and strip dimensions are read from the model scripts
+(taper_demo.py, corner_post_counter_to_mantel.py) rather than copied, so
+the cut sheets follow those scripts when they change.
+
+make_strip_solids() builds the matching 3D strips (used by
+corner_post_counter_to_mantel.py and shown by taper_demo_strips.py).
+
+Run directly to print the taper_demo.py post and write DXF/SVG cut sheets:
+
+    python strip_flat_pattern.py            # writes cut_sheets/taper_demo_cut_sheet.dxf/.svg
+    python strip_flat_pattern.py --out /tmp
+"""
+
+from math import asin, atan, ceil, cos, degrees, hypot, radians, sin, tan
+import argparse
+import os
+import time
+
+from model_capture import script_parameters
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+INCH = 25.4  # mm
+
+# === STRIP DEFAULTS: read from corner_post_counter_to_mantel.py ===
+_STRIPS = script_parameters(os.path.join(HERE, "corner_post_counter_to_mantel.py"))
+ARC_ANGLE = _STRIPS["ARC_ANGLE"]            # degrees (360 - 90° corner)
+STRIP_COUNT = _STRIPS["STRIP_COUNT"]
+GROUT_GAP = _STRIPS["GROUT_GAP"]
+TILE_THICKNESS = _STRIPS["TILE_THICKNESS"]
+
+# === TILE PLANK ===
+PLANK_WIDTH = 7.875 * INCH
+PLANK_LENGTH = 24 * INCH
+KERF = 0.050 * INCH           # continuous-rim diamond blade
+
+# === POST: the taper_demo.py 5-section stack, read from that script ===
+# (name, height, bottom radius, top radius) — outer radii; the section list
+# mirrors the build stack at the bottom of taper_demo.py
+_POST = script_parameters(os.path.join(HERE, "taper_demo.py"))
+TAPER_DEMO_POST = [
+    ("Base1", _POST["BASE1_HEIGHT"],
+     _POST["WIDE_RADIUS"] + _POST["OVERHANG"], _POST["WIDE_RADIUS"] + _POST["OVERHANG"]),
+    ("Tier1", _POST["TIER1_HEIGHT"], _POST["WIDE_RADIUS"], _POST["TIER1_TOP"]),
+    ("Base2", _POST["BASE2_HEIGHT"],
+     _POST["TIER1_TOP"] + _POST["OVERHANG"], _POST["TIER1_TOP"] + _POST["OVERHANG"]),
+    ("Tier2", _POST["TIER2_HEIGHT"], _POST["TIER2_START"], _POST["NARROW_RADIUS"]),
+    ("Cap", _POST["CAP_HEIGHT"],
+     _POST["NARROW_RADIUS"] + _POST["OVERHANG"], _POST["NARROW_RADIUS"] + _POST["OVERHANG"]),
+]
+
+
+# =============================================================================
+# FLAT-PATTERN ENGINE
+# =============================================================================
+
+def strip_pattern(height, bottom_radius, top_radius,
+                  strip_count=STRIP_COUNT, arc_angle=ARC_ANGLE, grout=GROUT_GAP,
+                  thickness=TILE_THICKNESS):
+    """Flat pattern of one tier's strips (all strips in a tier are identical).
+
+    Args:
+        height: tier height (vertical)
+        bottom_radius, top_radius: outer radius at the bottom and top
+        strip_count: strips around the arc
+        arc_angle: degrees of arc covered by the strips
+        grout: grout gap between strips, measured across the chord
+        thickness: tile thickness
+
+    Returns a dict, lengths in the input units and angles in degrees:
+        bottom_width, top_width   trapezoid parallel sides
+        length                    trapezoid height (along the tile)
+        edge_angle                taper of each long edge from the strip axis
+        bottom_corner, top_corner interior corner angles
+        facet_tilt                lean of the strip face from vertical
+        edge_bevel                bevel of each long edge from square, which
+                                  keeps the grout line full width through the tile
+        square_edge_gap           grout left at the back of the joint if the
+                                  edges are ripped square (<= 0: they collide)
+        pitch_angle               arc per strip + grout line
+        bottom_apothem, top_apothem  axis-to-face distance at bottom/top
+        center_angles             angular position of each strip (degrees,
+                                  arc centered on 0°, i.e. +X)
+    """
+    pitch = radians(arc_angle) / strip_count
+    half_cos = cos(pitch / 2)
+    bottom_width = 2 * bottom_radius * sin(pitch / 2) - grout
+    top_width = 2 * top_radius * sin(pitch / 2) - grout
+    if min(bottom_width, top_width) <= 0:
+        raise ValueError("Grout gap is wider than the strip chord")
+
+    lean = (bottom_radius - top_radius) * half_cos
+    length = hypot(height, lean)
+    edge = atan((bottom_width - top_width) / 2 / length)
+    tilt = atan(lean / height)
+
+    start = -arc_angle / 2
+    step = arc_angle / strip_count
+    return {
+        "bottom_width": bottom_width,
+        "top_width": top_width,
+        "length": length,
+        "edge_angle": degrees(edge),
+        "bottom_corner": 90 - degrees(edge),
+        "top_corner": 90 + degrees(edge),
+        "facet_tilt": degrees(tilt),
+        "edge_bevel": degrees(asin(cos(tilt) * sin(pitch / 2))),
+        "square_edge_gap": grout - 2 * thickness * cos(tilt) * tan(pitch / 2),
+        "pitch_angle": step,
+        "bottom_apothem": bottom_radius * half_cos,
+        "top_apothem": top_radius * half_cos,
+        "center_angles": [start + step * (i + 0.5) for i in range(strip_count)],
+    }
+
+
+def post_patterns(sections, **kwargs):
+    """Strip patterns for every section of a post.
+
+    `sections` is a list of (name, height, bottom_radius, top_radius).
+    Returns a list of (name, pattern) in the same order; extra keyword
+    arguments go to strip_pattern().
+    """
+    return [(name, strip_pattern(height, r0, r1, **kwargs))
+            for name, height, r0, r1 in sections]
+
+
+def plank_usage(pattern, strip_count=STRIP_COUNT, kerf=KERF,
+                plank_width=PLANK_WIDTH, plank_length=PLANK_LENGTH):
+    """How one tier's strips nest on a plank.
+
+    Strips alternate head-to-tail, so each rip is a straight cut at
+    ±edge_angle to the plank edge and the nested width is the sum of the
+    mean strip widths plus one kerf per cut.
+    Returns (width used, fits across the plank, fits along the plank).
+    """
+    mean_width = (pattern["bottom_width"] + pattern["top_width"]) / 2
+    used = strip_count * mean_width + (strip_count - 1) * kerf
+    return used, used <= plank_width, pattern["length"] <= plank_length
+
+
+# =============================================================================
+# 3D STRIPS
+# =============================================================================
+
+def make_strip_solids(height, bottom_radius, top_radius, z_offset,
+                      strip_count=STRIP_COUNT, arc_angle=ARC_ANGLE, grout=GROUT_GAP,
+                      thickness=TILE_THICKNESS):
+    """Flat tile strips for one tier as build123d solids, one facet per strip.
+
+    Each strip's outer face is the exact flat pattern from strip_pattern(),
+    thickened inward by `thickness`. The long edges are bevelled (cut
+    parallel to the radial plane between strips) so neighbours keep a full
+    grout line through the tile, and the ends are trimmed level with the tier.
+    """
+    from build123d import (BuildPart, BuildSketch, Keep, Plane, Polygon,
+                           Vector, extrude, split)
+
+    pattern = strip_pattern(height, bottom_radius, top_radius,
+                            strip_count, arc_angle, grout, thickness)
+    w0, w1 = pattern["bottom_width"], pattern["top_width"]
+    length = pattern["length"]
+    half_pitch = pattern["pitch_angle"] / 2
+    t = thickness
+    strips = []
+
+    for angle in pattern["center_angles"]:
+        c, s = cos(radians(angle)), sin(radians(angle))
+        bottom_mid = Vector(pattern["bottom_apothem"] * c, pattern["bottom_apothem"] * s, z_offset)
+        top_mid = Vector(pattern["top_apothem"] * c, pattern["top_apothem"] * s, z_offset + height)
+        across = Vector(-s, c, 0)
+        # Plane local X runs across the strip, local Y up the strip, Z outward
+        facet = Plane(origin=bottom_mid, x_dir=across,
+                      z_dir=across.cross(top_mid - bottom_mid))
+
+        # Oversized slab on the facet, then cut to the bevels and tier height
+        with BuildPart() as strip:
+            with BuildSketch(facet):
+                Polygon((-w0 / 2 - t, -t), (w0 / 2 + t, -t),
+                        (w1 / 2 + t, length + t), (-w1 / 2 - t, length + t), align=None)
+            extrude(amount=-t)
+            for side in (1, -1):
+                edge_angle = radians(angle + side * half_pitch)
+                toward_strip = Vector(side * sin(edge_angle), -side * cos(edge_angle), 0)
+                split(bisect_by=Plane(origin=bottom_mid + across * (side * w0 / 2),
+                                      z_dir=toward_strip))
+            split(bisect_by=Plane.XY.offset(z_offset))
+            split(bisect_by=Plane.XY.offset(z_offset + height), keep=Keep.BOTTOM)
+        strips.append(strip.part)
+
+    return strips
+
+
+# =============================================================================
+# CUT SHEET LAYOUT + DXF / SVG WRITERS
+# =============================================================================
+
+def trapezoid(pattern, x, y, flipped=False):
+    """Corner points of one strip, bottom edge at y (top edge if flipped)."""
+    w0, w1, length = pattern["bottom_width"], pattern["top_width"], pattern["length"]
+    cx = x + max(w0, w1) / 2
+    if flipped:
+        w0, w1 = w1, w0
+    return [(cx - w0 / 2, y), (cx + w0 / 2, y),
+            (cx + w1 / 2, y + length), (cx - w1 / 2, y + length)]
+
+
+def layout_sheet(patterns, strip_count=STRIP_COUNT, spacing=0.25 * INCH):
+    """Lay every strip of a post out flat, one row per section.
+
+    Strips in a row alternate head-to-tail, as they are nested on the
+    plank. Returns (outlines, labels, width, height) where outlines are
+    lists of (x, y) points and labels are (x, y, text).
+    """
+    outlines, labels = [], []
+    y = spacing
+    width = 0
+    for name, pattern in reversed(patterns):  # cap at the top of the sheet
+        pitch = max(pattern["bottom_width"], pattern["top_width"]) + spacing
+        x = spacing
+        for i in range(strip_count):
+            outlines.append(trapezoid(pattern, x, y, flipped=i % 2 == 1))
+            x += pitch
+        labels.append((
+            x, y + pattern["length"] / 2,
+            f"{name}: {pattern['bottom_width'] / INCH:.3f}\" -> "
+            f"{pattern['top_width'] / INCH:.3f}\" x {pattern['length'] / INCH:.3f}\", "
+            f"edge {pattern['edge_angle']:.2f} deg, bevel {pattern['edge_bevel']:.1f} deg",
+        ))
+        width = max(width, x)
+        y += pattern["length"] + spacing
+    return outlines, labels, width, y
+
+
+def write_dxf(path, outlines, labels, text_height=0.15 * INCH):
+    """Write outlines as closed LINE loops plus TEXT labels (DXF R12, mm)."""
+    out = ["0", "SECTION", "2", "HEADER", "9", "$INSUNITS", "70", "4",
+           "0", "ENDSEC", "0", "SECTION", "2", "ENTITIES"]
+    for points in outlines:
+        for (x0, y0), (x1, y1) in zip(points, points[1:] + points[:1]):
+            out += ["0", "LINE", "8", "CUT",
+                    "10", f"{x0:.4f}", "20", f"{y0:.4f}", "30", "0.0",
+                    "11", f"{x1:.4f}", "21", f"{y1:.4f}", "31", "0.0"]
+    for x, y, text in labels:
+        out += ["0", "TEXT", "8", "LABELS",
+                "10", f"{x:.4f}", "20", f"{y:.4f}", "30", "0.0",
+                "40", f"{text_height:.4f}", "1", text]
+    out += ["0", "ENDSEC", "0", "EOF"]
+    with open(path, "w") as f:
+        f.write("\n".join(out) + "\n")
+
+
+def write_svg(path, outlines, labels, width, height, text_height=0.15 * INCH):
+    """Write outlines and labels as a 1:1 SVG (mm), Y up like the DXF."""
+    label_room = 3.5 * INCH
+    total_w = width + label_room
+
+    def flip(y):
+        return height - y
+
+    out = [f'<svg xmlns="http://www.w3.org/2000/svg" '
+           f'width="{total_w:.2f}mm" height="{height:.2f}mm" '
+           f'viewBox="0 0 {total_w:.2f} {height:.2f}">']
+    for points in outlines:
+        pts = " ".join(f"{x:.3f},{flip(y):.3f}" for x, y in points)
+        out.append(f'<polygon points="{pts}" fill="none" stroke="black" stroke-width="0.2"/>')
+    for x, y, text in labels:
+        out.append(f'<text x="{x:.2f}" y="{flip(y):.2f}" font-size="{text_height:.2f}" '
+                   f'font-family="sans-serif">{text}</text>')
+    out.append("</svg>")
+    with open(path, "w") as f:
+        f.write("\n".join(out) + "\n")
+
+
+def write_cut_sheets(basename, sections, strip_count=STRIP_COUNT, **kwargs):
+    """Compute a post's strips and write <basename>.dxf and <basename>.svg."""
+    patterns = post_patterns(sections, strip_count=strip_count, **kwargs)
+    outlines, labels, width, height = layout_sheet(patterns, strip_count)
+    write_dxf(basename + ".dxf", outlines, labels)
+    write_svg(basename + ".svg", outlines, labels, width, height)
+    return patterns
+
+
+# =============================================================================
+# MAIN: taper_demo.py post
+# =============================================================================
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--out", default=os.path.join(HERE, "cut_sheets"),
+                        help="output directory (default: cad/cut_sheets)")
+    args = parser.parse_args()
+    os.makedirs(args.out, exist_ok=True)
+    basename = os.path.join(args.out, "taper_demo_cut_sheet")
+
+    t0 = time.perf_counter()
+    patterns = write_cut_sheets(basename, TAPER_DEMO_POST)
+    elapsed_ms = (time.perf_counter() - t0) * 1000
+
+    print("=== TAPERED STRIP FLAT PATTERNS (taper_demo.py post) ===")
+    print(f"{STRIP_COUNT} strips per section, {GROUT_GAP/INCH:.3f}\" grout, "
+          f"{KERF/INCH:.3f}\" kerf")
+    print()
+    print(f"{'Section':8s} {'Bottom':>8s} {'Top':>8s} {'Length':>8s} "
+          f"{'Edge°':>6s} {'Tilt°':>6s} {'Bevel°':>6s} {'Nested':>8s}")
+    for name, p in patterns:
+        used, fits_across, fits_along = plank_usage(p)
+        if not fits_along:
+            fits = "longer than plank"
+        else:
+            fits = "1 plank" if fits_across else f"{ceil(used / PLANK_WIDTH)} planks"
+        print(f"{name:8s} {p['bottom_width']/INCH:7.3f}\" {p['top_width']/INCH:7.3f}\" "
+              f"{p['length']/INCH:7.3f}\" {p['edge_angle']:6.2f} {p['facet_tilt']:6.2f} "
+              f"{p['edge_bevel']:6.2f} "
+              f"{used/INCH:6.2f}\"  {fits}")
+    print()
+    print("Bed angle for each rip = edge angle (flip the tile between cuts)")
+    square_gaps = [p["square_edge_gap"] for _, p in patterns]
+    if min(square_gaps) <= 0:
+        print(f"Blade tilt for each rip = bevel: square edges would close the "
+              f"{GROUT_GAP/INCH:.3f}\" grout by up to {(GROUT_GAP - min(square_gaps))/INCH:.3f}\" "
+              f"at the back")
+    print(f"Wrote {basename}.dxf / .svg in {elapsed_ms:.1f} ms")
@@ -0,0 +1,46 @@
+# %% taper_demo.py Post Built From Flat Strips
+# The 3D counterpart of the strip_flat_pattern.py cut sheet: every section
+# of the taper_demo.py post as bevelled flat tile strips (trapezoids on the
+# tapered tiers), exactly as they come off the cutting sled.
+
+from build123d import *
+from ocp_vscode import show
+
+from strip_flat_pattern import (GROUT_GAP, STRIP_COUNT, TAPER_DEMO_POST,
+                                make_strip_solids, strip_pattern)
+
+INCH = 25.4
+
+# Same colors as taper_demo.py, section by section
+SECTION_COLORS = {
+    "Base1": "slategray",
+    "Tier1": "sienna",
+    "Base2": "darkgray",
+    "Tier2": "peru",
+    "Cap": "dimgray",
+}
+
+print("=== TAPER DEMO POST FROM FLAT STRIPS ===")
+print(f"{STRIP_COUNT} strips per section, {GROUT_GAP/INCH:.3f}\" grout")
+print()
+
+# Build stack
+z = 0
+parts = []
+colors = []
+names = []
+
+for name, height, bottom_radius, top_radius in TAPER_DEMO_POST:
+    pattern = strip_pattern(height, bottom_radius, top_radius)
+    print(f"Building {name}: {pattern['bottom_width']/INCH:.3f}\" → "
+          f"{pattern['top_width']/INCH:.3f}\" strips, bevel {pattern['edge_bevel']:.1f}°")
+    strips = make_strip_solids(height, bottom_radius, top_radius, z)
+    parts.append(Compound(strips))
+    colors.append(SECTION_COLORS.get(name, "gray"))
+    names.append(f"{name} strips")
+    z += height
+
+print("\nSending to viewer...")
+show(*parts, colors=colors, names=names)
+
+print(f"Done! {len(parts)} sections, {len(parts) * STRIP_COUNT} strips")
@@ -0,0 +1,456 @@
+"""
+Offscreen Thumbnail Renderer — PNG Previews Without a Viewer or GPU
+===================================================================
+
+Renders model scripts (or parameter sweeps of one script) to PNG
+thumbnails and a contact sheet, entirely on the CPU:
+
+- parts are tessellated and colored with the colors the scripts already
+  pass to show() / show_object() (captured by model_capture.py)
+- a vectorized NumPy z-buffer rasterizer draws all triangles of a frame
+  as scanline spans in batches (no per-triangle or per-pixel Python loop)
+- flat Lambert shading from one light plus ambient, 2x supersampled
+- PNGs are written with zlib from the standard library
+
+    python thumbnail_renderer.py                          # every model in cad/
+    python thumbnail_renderer.py taper_demo.py \\
+        --sweep WIDE_RADIUS=2.0*INCH,2.3*INCH,2.6*INCH \\
+        --sweep NARROW_RADIUS=1.2*INCH,1.4*INCH           # 6 variants
+
+Variants of a sweep are drawn at one scale per script, so parameter
+changes show as size changes. Output goes to thumbnails/: one PNG per
+model or variant, plus contact_sheet.png and contact_sheet.txt (cell
+number → variant).
+"""
+
+import argparse
+import itertools
+import os
+import struct
+import sys
+import time
+import zlib
+
+import numpy as np
+
+from check_fingerprints import MODELS  # models rendered when no script is named
+from model_capture import capture_model
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+# === RENDER DEFAULTS ===
+THUMB_SIZE = 256               # px, square
+SUPERSAMPLE = 2                # render at 2x and box-filter down
+MARGIN = 0.06                  # fraction of the frame left empty on each side
+VIEW_DIRECTION = (1.0, -1.0, 0.8)   # from the model toward the camera (iso-like)
+LIGHT_DIRECTION = (0.4, -0.7, 1.0)
+AMBIENT = 0.35
+BACKGROUND = (255, 255, 255)
+DEFAULT_COLOR = (160, 160, 170)
+
+# Rough cap on fragments generated per rasterizer batch
+FRAGMENT_BUDGET = 4_000_000
+
+
+# CSS colors used by the model scripts (others fall back to DEFAULT_COLOR)
+NAMED_COLORS = {
+    "black": (0, 0, 0), "white": (255, 255, 255), "gray": (128, 128, 128),
+    "grey": (128, 128, 128), "darkgray": (169, 169, 169), "dimgray": (105, 105, 105),
+    "lightgray": (211, 211, 211), "slategray": (112, 128, 144), "silver": (192, 192, 192),
+    "sienna": (160, 82, 45), "peru": (205, 133, 63), "tan": (210, 180, 140),
+    "burlywood": (222, 184, 135), "chocolate": (210, 105, 30), "brown": (165, 42, 42),
+    "red": (255, 0, 0), "orange": (255, 165, 0), "gold": (255, 215, 0),
+    "yellow": (255, 255, 0), "green": (0, 128, 0), "blue": (0, 0, 255),
+    "steelblue": (70, 130, 180), "navy": (0, 0, 128),
+}
+
+
+# =============================================================================
+# COLORS AND MESHES
+# =============================================================================
+
+def resolve_color(color):
+    """Return an RGB tuple (0-255) for a CSS name, '#rrggbb', or RGB tuple.
+
+    Tuples with all components <= 1.0 are taken as 0-1 floats.
+    """
+    if color is None:
+        return DEFAULT_COLOR
+    if isinstance(color, str):
+        if color.startswith("#") and len(color) == 7:
+            return tuple(int(color[i:i + 2], 16) for i in (1, 3, 5))
+        return NAMED_COLORS.get(color.lower().replace(" ", ""), DEFAULT_COLOR)
+    rgb = tuple(color)[:3]
+    if all(isinstance(c, float) and c <= 1.0 for c in rgb):
+        return tuple(int(round(c * 255)) for c in rgb)
+    return tuple(int(c) for c in rgb)
+
+
+def part_mesh(part, tolerance=None):
+    """Return (vertices (N,3) float64, triangles (M,3) int64) for a part.
+
+    `part` is a dict from capture_model() (key "shape"), or a dict with
+    ready-made "vertices" and "faces" arrays (e.g. from polycam_obj).
+    """
+    if "vertices" in part:
+        return np.asarray(part["vertices"], float), np.asarray(part["faces"], np.int64)
+
+    shape = part["shape"]
+    if tolerance is None:
+        # Chordal tolerance relative to part size: plenty for a thumbnail
+        tolerance = max(shape.bounding_box().diagonal * 2e-3, 0.01)
+    vertices, triangles = shape.tessellate(tolerance, 0.3)
+    if not triangles:
+        return np.zeros((0, 3)), np.zeros((0, 3), np.int64)
+    return (np.array([(v.X, v.Y, v.Z) for v in vertices], float),
+            np.array(triangles, np.int64))
+
+
+# =============================================================================
+# RASTERIZER
+# =============================================================================
+
+def _camera_basis(view_direction):
+    """Orthonormal (right, up, toward-camera) vectors for an orthographic view."""
+    toward = np.asarray(view_direction, float)
+    toward /= np.linalg.norm(toward)
+    right = np.cross((0.0, 0.0, 1.0), toward)
+    if np.linalg.norm(right) < 1e-9:  # looking straight down/up
+        right = np.array([1.0, 0.0, 0.0])
+    right /= np.linalg.norm(right)
+    up = np.cross(toward, right)
+    return right, up, toward
+
+
+def _expand(counts):
+    """For counts [2, 3] return owners [0, 0, 1, 1, 1] and offsets [0, 1, 0, 1, 2]."""
+    owners = np.repeat(np.arange(len(counts)), counts)
+    starts = np.cumsum(counts) - counts
+    return owners, np.arange(owners.size) - starts[owners]
+
+
+def _rasterize(screen, depth, tri_colors, width, height, background):
+    """Z-buffer rasterize screen-space triangles.
+
+    Args:
+        screen: (M, 3, 2) pixel coordinates of each triangle's corners
+        depth: (M, 3) depth per corner (larger = closer to the camera)
+        tri_colors: (M, 3) float RGB per triangle
+    Returns an (height, width, 3) float image.
+
+    Scanline spans, vectorized: every (triangle, pixel row) pair gets its
+    covered x-interval from the three edges, spans are expanded into
+    fragments, and depth comes from each triangle's screen-space plane.
+    Work is proportional to the pixels actually covered.
+    """
+    zbuf = np.full(width * height, -np.inf)
+    cbuf = np.tile(np.asarray(background, float), (width * height, 1))
+
+    # Rows whose pixel centers (y + 0.5) fall inside each triangle's y-range
+    ys = screen[:, :, 1]
+    row0 = np.clip(np.ceil(ys.min(axis=1) - 0.5), 0, height).astype(np.int64)
+    row1 = np.clip(np.floor(ys.max(axis=1) - 0.5), -1, height - 1).astype(np.int64)
+    rows_per_tri = np.maximum(row1 - row0 + 1, 0)
+
+    # Depth plane z = a*x + b*y + c for each triangle (orthographic: exact)
+    p0, p1, p2 = screen[:, 0], screen[:, 1], screen[:, 2]
+    e1, e2 = p1 - p0, p2 - p0
+    det = e1[:, 0] * e2[:, 1] - e1[:, 1] * e2[:, 0]
+    dz1, dz2 = depth[:, 1] - depth[:, 0], depth[:, 2] - depth[:, 0]
+    plane_a = (dz1 * e2[:, 1] - dz2 * e1[:, 1]) / det
+    plane_b = (dz2 * e1[:, 0] - dz1 * e2[:, 0]) / det
+    plane_c = depth[:, 0] - plane_a * p0[:, 0] - plane_b * p0[:, 1]
+
+    # Process triangles in chunks that keep the fragment count bounded
+    width_est = np.ceil(np.ptp(screen[:, :, 0], axis=1)) + 1
+    cost = np.cumsum(rows_per_tri * width_est)
+    chunk_ids = (cost // FRAGMENT_BUDGET).astype(np.int64)
+
+    for chunk in np.unique(chunk_ids):
+        tris = np.nonzero((chunk_ids == chunk) & (rows_per_tri > 0))[0]
+        if tris.size == 0:
+            continue
+
+        # One entry per (triangle, row)
+        owner, row_offset = _expand(rows_per_tri[tris])
+        tri = tris[owner]
+        yc = row0[tri] + row_offset + 0.5
+
+        # Intersect the row center line with the three edges
+        x_left = np.full(tri.size, np.inf)
+        x_right = np.full(tri.size, -np.inf)
+        for i, j in ((0, 1), (1, 2), (2, 0)):
+            xa, ya = screen[tri, i, 0], screen[tri, i, 1]
+            xb, yb = screen[tri, j, 0], screen[tri, j, 1]
+            crosses = (np.minimum(ya, yb) <= yc) & (yc <= np.maximum(ya, yb)) & (ya != yb)
+            t = np.where(crosses, (yc - ya) / np.where(ya != yb, yb - ya, 1.0), 0.0)
+            x = xa + t * (xb - xa)
+            x_left = np.where(crosses, np.minimum(x_left, x), x_left)
+            x_right = np.where(crosses, np.maximum(x_right, x), x_right)
+
+        valid = np.isfinite(x_left)
+        col0 = np.clip(np.ceil(np.where(valid, x_left, 0) - 0.5), 0, width).astype(np.int64)
+        col1 = np.clip(np.floor(np.where(valid, x_right, -1) - 0.5), -1, width - 1).astype(np.int64)
+        span = np.where(valid, np.maximum(col1 - col0 + 1, 0), 0)
+
+        # One entry per fragment
+        span_owner, col_offset = _expand(span)
+        if span_owner.size == 0:
+            continue
+        frag_tri = tri[span_owner]
+        col = col0[span_owner] + col_offset
+        row = (yc[span_owner] - 0.5).astype(np.int64)
+        frag_depth = (plane_a[frag_tri] * (col + 0.5) + plane_b[frag_tri] * (row + 0.5)
+                      + plane_c[frag_tri])
+        pixel = row * width + col
+
+        # Nearest fragment per pixel in this chunk, then against the z-buffer
+        order = np.lexsort((-frag_depth, pixel))
+        pixel, frag_depth, frag_tri = pixel[order], frag_depth[order], frag_tri[order]
+        first = np.ones(pixel.size, bool)
+        first[1:] = pixel[1:] != pixel[:-1]
+        pixel, frag_depth, frag_tri = pixel[first], frag_depth[first], frag_tri[first]
+
+        closer = frag_depth > zbuf[pixel]
+        pixel = pixel[closer]
+        zbuf[pixel] = frag_depth[closer]
+        cbuf[pixel] = tri_colors[frag_tri[closer]]
+
+    return cbuf.reshape(height, width, 3)
+
+
+def projected_span(parts, view_direction=VIEW_DIRECTION):
+    """Width of the parts' bounding boxes as seen from `view_direction` (mm).
+
+    An upper bound on the rendered extent, cheap enough to compute for
+    every variant before any of them is tessellated.
+    """
+    right, up, _ = _camera_basis(view_direction)
+    corners = []
+    for part in parts:
+        bb = part["shape"].bounding_box()
+        corners.extend(itertools.product((bb.min.X, bb.max.X), (bb.min.Y, bb.max.Y),
+                                         (bb.min.Z, bb.max.Z)))
+    if not corners:
+        return 0.0
+    xyz = np.asarray(corners, float)
+    return float(max(np.ptp(xyz @ right), np.ptp(xyz @ up)))
+
+
+def render(parts, size=THUMB_SIZE, view_direction=VIEW_DIRECTION,
+           supersample=SUPERSAMPLE, background=BACKGROUND, span=None):
+    """Render parts to an (size, size, 3) uint8 RGB image.
+
+    Parts with alpha < 1 are drawn opaque but faded toward the background,
+    so reference geometry reads as lighter than the fabricated parts.
+
+    By default the parts fill the frame. Pass `span` (mm across the frame,
+    e.g. from projected_span()) to render several images at one scale.
+    """
+    right, up, toward = _camera_basis(view_direction)
+    light = np.asarray(LIGHT_DIRECTION, float)
+    light /= np.linalg.norm(light)
+    bg = np.asarray(background, float)
+
+    all_xyz, all_tris, all_colors = [], [], []
+    offset = 0
+    for part in parts:
+        vertices, triangles = part_mesh(part)
+        if len(triangles) == 0:
+            continue
+        corners = vertices[triangles]
+        normals = np.cross(corners[:, 1] - corners[:, 0], corners[:, 2] - corners[:, 0])
+        lengths = np.linalg.norm(normals, axis=1)
+        keep = lengths > 1e-12
+        normals = normals[keep] / lengths[keep, None]
+
+        base = np.asarray(resolve_color(part.get("color")), float)
+        shade = AMBIENT + (1 - AMBIENT) * np.abs(normals @ light)
+        colors = shade[:, None] * base[None, :]
+        alpha = part.get("alpha", 1.0)
+        if alpha < 1.0:
+            colors = alpha * colors + (1 - alpha) * bg
+
+        all_xyz.append(vertices)
+        all_tris.append(triangles[keep] + offset)
+        all_colors.append(colors)
+        offset += len(vertices)
+
+    pixels = size * supersample
+    if not all_tris:
+        return np.full((size, size, 3), background, np.uint8)
+
+    xyz = np.concatenate(all_xyz)
+    tris = np.concatenate(all_tris)
+    colors = np.concatenate(all_colors)
+
+    # Orthographic projection, fitted to the frame unless a span is given
+    sx, sy, depth = xyz @ right, xyz @ up, xyz @ toward
+    if span is None:
+        span = max(sx.max() - sx.min(), sy.max() - sy.min())
+    span = max(span, 1e-9)
+    scale = pixels * (1 - 2 * MARGIN) / span
+    px = (sx - (sx.min() + sx.max()) / 2) * scale + pixels / 2
+    py = pixels / 2 - (sy - (sy.min() + sy.max()) / 2) * scale
+    screen = np.stack([px, py], axis=1)[tris]
+
+    # Triangles seen edge-on cover no pixels
+    edge1, edge2 = screen[:, 1] - screen[:, 0], screen[:, 2] - screen[:, 0]
+    visible = np.abs(edge1[:, 0] * edge2[:, 1] - edge1[:, 1] * edge2[:, 0]) > 1e-9
+    screen, tris, colors = screen[visible], tris[visible], colors[visible]
+
+    image = _rasterize(screen, depth[tris], colors, pixels, pixels, background)
+    if supersample > 1:
+        image = image.reshape(size, supersample, size, supersample, 3).mean(axis=(1, 3))
+    return np.clip(np.round(image), 0, 255).astype(np.uint8)
+
+
+# =============================================================================
+# PNG + CONTACT SHEET
+# =============================================================================
+
+def write_png(path, rgb):
+    """Write an (H, W, 3) uint8 array as an 8-bit RGB PNG."""
+    height, width, _ = rgb.shape
+    raw = np.zeros((height, width * 3 + 1), np.uint8)  # filter byte 0 per row
+    raw[:, 1:] = rgb.reshape(height, -1)
+
+    def chunk(tag, data):
+        body = tag + data
+        return struct.pack(">I", len(data)) + body + struct.pack(">I", zlib.crc32(body))
+
+    with open(path, "wb") as f:
+        f.write(b"\x89PNG\r\n\x1a\n")
+        f.write(chunk(b"IHDR", struct.pack(">IIBBBBB", width, height, 8, 2, 0, 0, 0)))
+        f.write(chunk(b"IDAT", zlib.compress(raw.tobytes(), 6)))
+        f.write(chunk(b"IEND", b""))
+
+
+# 3x5 pixel digits for numbering contact sheet cells
+_DIGITS = {
+    "0": "111101101101111", "1": "010110010010111", "2": "111001111100111",
+    "3": "111001111001111", "4": "101101111001001", "5": "111100111001111",
+    "6": "111100111101111", "7": "111001010010010", "8": "111101111101111",
+    "9": "111101111001111",
+}
+
+
+def _stamp_number(image, number, x, y, scale=3, color=(0, 0, 0)):
+    """Draw `number` into `image` with its top-left corner at (x, y)."""
+    for k, ch in enumerate(str(number)):
+        glyph = np.array([int(b) for b in _DIGITS[ch]], bool).reshape(5, 3)
+        glyph = np.kron(glyph, np.ones((scale, scale), bool))
+        gx = x + k * 4 * scale
+        region = image[y:y + glyph.shape[0], gx:gx + glyph.shape[1]]
+        region[glyph[:region.shape[0], :region.shape[1]]] = color
+
+
+def contact_sheet(images, columns=None, pad=4, background=BACKGROUND):
+    """Tile thumbnails into one image; each cell is numbered from 1."""
+    count = len(images)
+    columns = columns or int(np.ceil(np.sqrt(count)))
+    rows = int(np.ceil(count / columns))
+    h, w, _ = images[0].shape
+    sheet = np.empty((rows * (h + pad) + pad, columns * (w + pad) + pad, 3), np.uint8)
+    sheet[:] = background
+    for i, img in enumerate(images):
+        r, c = divmod(i, columns)
+        y, x = pad + r * (h + pad), pad + c * (w + pad)
+        sheet[y:y + h, x:x + w] = img
+        _stamp_number(sheet, i + 1, x + 4, y + 4)
+    return sheet
+
+
+# =============================================================================
+# BATCH
+# =============================================================================
+
+def _variant_name(script, overrides):
+    stem = os.path.splitext(os.path.basename(script))[0]
+    if not overrides:
+        return stem
+    tags = "__".join(f"{k}={v}" for k, v in overrides.items())
+    return f"{stem}__{tags}".replace("*", "x").replace("/", "-").replace(" ", "")
+
+
+def render_batch(jobs, out_dir, size=THUMB_SIZE, common_scale=False):
+    """Render (script, overrides) jobs; write PNGs and a contact sheet.
+
+    With `common_scale`, all variants of one script are drawn at the same
+    scale (the largest variant fills its frame), so a parameter sweep
+    shows real size differences. Otherwise each image fills its frame.
+
+    Returns a list of (variant name, png path or error message).
+    """
+    os.makedirs(out_dir, exist_ok=True)
+    captured, results = [], []
+    spans = {}
+    for script, overrides in jobs:
+        name = _variant_name(script, overrides)
+        try:
+            parts = capture_model(os.path.join(HERE, script), overrides)
+        except Exception as exc:  # a bad variant shouldn't stop the batch
+            results.append((name, f"FAILED: {exc}"))
+            continue
+        if common_scale:
+            spans[script] = max(spans.get(script, 0.0), projected_span(parts))
+        captured.append((script, name, parts))
+
+    images = []
+    for i, (script, name, parts) in enumerate(captured):
+        image = render(parts, size=size, span=spans.get(script))
+        captured[i] = (script, name, None)  # drop the shapes once drawn
+        path = os.path.join(out_dir, name + ".png")
+        write_png(path, image)
+        images.append(image)
+        results.append((name, path))
+
+    if images:
+        write_png(os.path.join(out_dir, "contact_sheet.png"), contact_sheet(images))
+        with open(os.path.join(out_dir, "contact_sheet.txt"), "w") as f:
+            for i, (_, name, _) in enumerate(captured, 1):
+                f.write(f"{i:4d}  {name}\n")
+    return results
+
+
+def _parse_sweeps(sweeps):
+    """['A=1,2', 'B=x,y'] → list of override dicts (cartesian product)."""
+    axes = []
+    for sweep in sweeps:
+        name, _, values = sweep.partition("=")
+        if not values:
+            raise ValueError(f"--sweep needs NAME=v1,v2,...: {sweep!r}")
+        axes.append([(name.strip(), v.strip()) for v in values.split(",")])
+    return [dict(combo) for combo in itertools.product(*axes)] if axes else [{}]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("models", nargs="*", help="model scripts (default: all)")
+    parser.add_argument("--sweep", action="append", default=[],
+                        metavar="NAME=v1,v2,...",
+                        help="sweep a top-level parameter (repeat for a grid)")
+    parser.add_argument("--out", default=os.path.join(HERE, "thumbnails"),
+                        help="output directory (default: cad/thumbnails)")
+    parser.add_argument("--size", type=int, default=THUMB_SIZE, help="thumbnail size, px")
+    args = parser.parse_args(argv)
+
+    scripts = [m if m.endswith(".py") else m + ".py" for m in args.models] or MODELS
+    jobs = [(script, overrides) for script in scripts
+            for overrides in _parse_sweeps(args.sweep)]
+
+    t0 = time.perf_counter()
+    # Sweeps share one scale per script so size changes stay visible
+    results = render_batch(jobs, args.out, size=args.size, common_scale=bool(args.sweep))
+    seconds = time.perf_counter() - t0
+
+    failed = [r for r in results if r[1].startswith("FAILED")]
+    for name, message in failed:
+        print(f"{name}: {message}")
+    print(f"Rendered {len(results) - len(failed)}/{len(results)} thumbnails "
+          f"to {args.out} in {seconds:.1f} s")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,23 +1,60 @@
 # %% Polycam Scan Viewer
 # Load and display the fireplace corner scan in OCP CAD Viewer
+#   .stl — geometry only, dimensional reference
+#   .obj — geometry + texture atlas for visual context (see polycam_obj.py);
+#          the atlas is decoded lazily at TEXTURE_LEVEL, not full resolution,
+#          and baked to per-triangle colors: the viewer takes one color per
+#          object, so triangles are shown in groups of similar color
 
 from build123d import *
 from ocp_vscode import show
 import os
+import time
 
-# Path to the Polycam STL export
+from polycam_obj import load_obj
+
+# Path to the Polycam export (.stl or .obj)
 SCAN_PATH = os.path.join(os.path.dirname(__file__), "../polycam/2_1_2026.stl")
 
+# OBJ only: texture mip level (0 = full resolution, each level halves W and H)
+TEXTURE_LEVEL = 3
+# OBJ only: color levels per channel when grouping triangles (4 → up to 64 groups)
+COLOR_STEPS = 4
+
 print(f"Loading scan from: {SCAN_PATH}")
+t0 = time.perf_counter()
 
 # Import the mesh
-scan_mesh = import_stl(SCAN_PATH)
+if SCAN_PATH.lower().endswith(".obj"):
+    scan = load_obj(SCAN_PATH)
+    print(f"Parsed {len(scan.vertices)} vertices, {len(scan.faces)} triangles "
+          f"({scan.nbytes / 1e6:.1f} MB of arrays)")
+    if scan.texture is not None and scan.face_uvs is not None:
+        groups = scan.color_groups(TEXTURE_LEVEL, COLOR_STEPS)
+        meshes = [scan.to_face(triangles) for _, triangles in groups]
+        colors = ["#%02x%02x%02x" % rgb for rgb, _ in groups]
+        w, h = scan.texture.size
+        print(f"Texture {w}x{h} decoded at level {TEXTURE_LEVEL} "
+              f"({w >> TEXTURE_LEVEL}x{h >> TEXTURE_LEVEL}), "
+              f"baked into {len(groups)} color groups")
+    else:
+        meshes, colors = [scan.to_face()], None
+else:
+    meshes, colors = [import_stl(SCAN_PATH)], None
+
+bounds = meshes[0].bounding_box()
+for mesh in meshes[1:]:
+    bounds = bounds.add(mesh.bounding_box())
 
-print(f"Mesh loaded successfully")
-print(f"Bounding box: {scan_mesh.bounding_box()}")
+print(f"Mesh loaded successfully in {time.perf_counter() - t0:.1f} s")
+print(f"Bounding box: {bounds}")
 
 # Display in viewer
-show(scan_mesh)
+names = [f"Scan {i + 1}" for i in range(len(meshes))] if len(meshes) > 1 else None
+if colors:
+    show(*meshes, colors=colors, names=names)
+else:
+    show(*meshes)
 
 print("Scan displayed in OCP CAD Viewer")
 print("Use right-drag to orbit, scroll to zoom")